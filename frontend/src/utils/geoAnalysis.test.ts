@@ -0,0 +1,139 @@
+import { describe, it, expect, vi } from "vitest";
+import booleanPointInPolygon from "@turf/boolean-point-in-polygon";
+import type { FeatureCollection, Position } from "geojson";
+import { findNearbyOffices, findOverlappingAOIs } from "./geoAnalysis";
+
+// Wrap turf in a spy so tests can see which polygons reach the full test
+vi.mock("@turf/boolean-point-in-polygon", async (importOriginal) => {
+  const actual = await importOriginal<typeof import("@turf/boolean-point-in-polygon")>();
+  return { default: vi.fn(actual.default) };
+});
+
+const square = (x0: number, y0: number, size: number) => [
+  [
+    [x0, y0],
+    [x0 + size, y0],
+    [x0 + size, y0 + size],
+    [x0, y0 + size],
+    [x0, y0],
+  ],
+];
+
+const territories: FeatureCollection = {
+  type: "FeatureCollection",
+  features: [
+    {
+      type: "Feature",
+      properties: { Name: "Islands" },
+      geometry: { type: "MultiPolygon", coordinates: [square(0, 0, 1), square(5, 5, 1)] },
+    },
+    {
+      type: "Feature",
+      properties: { Name: "Mainland" },
+      geometry: { type: "Polygon", coordinates: square(-10, -10, 20) },
+    },
+  ],
+};
+
+describe("findOverlappingAOIs", () => {
+  it("matches a point inside the second part of a MultiPolygon", () => {
+    const names = findOverlappingAOIs(5.5, 5.5, { bc_territories: territories }).map((o) => o.featureName);
+    expect(names).toEqual(["Islands", "Mainland"]);
+  });
+
+  it("skips MultiPolygon parts whose bbox does not contain the point", () => {
+    const islands: FeatureCollection = { type: "FeatureCollection", features: [territories.features[0]] };
+    const pip = vi.mocked(booleanPointInPolygon);
+    pip.mockClear();
+
+    // (3, 3) is inside the MultiPolygon's overall bbox but outside each part's bbox
+    expect(findOverlappingAOIs(3, 3, { bc_territories: islands })).toEqual([]);
+    expect(pip).not.toHaveBeenCalled();
+  });
+
+  it("reports a feature once when two of its parts contain the point", () => {
+    const overlapping: FeatureCollection = {
+      type: "FeatureCollection",
+      features: [
+        {
+          type: "Feature",
+          properties: { Name: "Overlap" },
+          geometry: { type: "MultiPolygon", coordinates: [square(0, 0, 2), square(1, 1, 2)] },
+        },
+      ],
+    };
+
+    const names = findOverlappingAOIs(1.5, 1.5, { bc_territories: overlapping }).map((o) => o.featureName);
+    expect(names).toEqual(["Overlap"]);
+  });
+
+  it("skips malformed features and still matches valid ones in the layer", () => {
+    const layer: FeatureCollection = {
+      type: "FeatureCollection",
+      features: [
+        {
+          type: "Feature",
+          properties: { Name: "Null position" },
+          geometry: { type: "Polygon", coordinates: [[null, [0, 0], [1, 1]]] as unknown as Position[][] },
+        },
+        {
+          type: "Feature",
+          properties: { Name: "Not an array" },
+          geometry: { type: "MultiPolygon", coordinates: "bad" as unknown as Position[][][] },
+        },
+        {
+          type: "Feature",
+          properties: { Name: "Valid" },
+          geometry: { type: "Polygon", coordinates: square(0, 0, 2) },
+        },
+      ],
+    };
+
+    const names = () => findOverlappingAOIs(1, 1, { bc_territories: layer }).map((o) => o.featureName);
+    expect(names()).toEqual(["Valid"]);
+    // The index is cached per layer; later lookups must keep working
+    expect(names()).toEqual(["Valid"]);
+  });
+
+  it("returns nothing outside every layer", () => {
+    expect(findOverlappingAOIs(50, 50, { bc_territories: territories, bc_treaties: null })).toEqual([]);
+  });
+});
+
+describe("findNearbyOffices", () => {
+  const pois: FeatureCollection = {
+    type: "FeatureCollection",
+    features: [
+      { type: "Feature", properties: { name: "Far" }, geometry: { type: "Point", coordinates: [-120.0, 50.5] } },
+      { type: "Feature", properties: { name: "Near", code: 7 }, geometry: { type: "Point", coordinates: [-120.0, 50.1] } },
+      { type: "Feature", properties: { name: "Away" }, geometry: { type: "Point", coordinates: [-110.0, 50.0] } },
+    ],
+  };
+
+  it("returns offices within range sorted by distance", () => {
+    const offices = findNearbyOffices(50.0, -120.0, pois, 100);
+    expect(offices.map((o) => o.name)).toEqual(["Near", "Far"]);
+    expect(offices[0].code).toBe(7);
+    expect(offices[0].distance).toBeCloseTo(11.1, 1);
+  });
+
+  it("keeps offices just inside maxDistance north and south and drops those just outside", () => {
+    // 100 km along a meridian is ~0.8993 degrees of latitude
+    const meridian: FeatureCollection = {
+      type: "FeatureCollection",
+      features: [
+        { type: "Feature", properties: { name: "Edge north" }, geometry: { type: "Point", coordinates: [-120.0, 50.8993] } },
+        { type: "Feature", properties: { name: "Beyond north" }, geometry: { type: "Point", coordinates: [-120.0, 50.9] } },
+        { type: "Feature", properties: { name: "Edge south" }, geometry: { type: "Point", coordinates: [-120.0, 49.1007] } },
+        { type: "Feature", properties: { name: "Beyond south" }, geometry: { type: "Point", coordinates: [-120.0, 49.1] } },
+      ],
+    };
+
+    const names = findNearbyOffices(50.0, -120.0, meridian, 100).map((o) => o.name);
+    expect(names.sort()).toEqual(["Edge north", "Edge south"]);
+  });
+
+  it("returns empty for a missing layer", () => {
+    expect(findNearbyOffices(50.0, -120.0, null)).toEqual([]);
+  });
+});
@@ -4,7 +4,7 @@
  */
 import booleanPointInPolygon from '@turf/boolean-point-in-polygon';
 import { point } from '@turf/helpers';
-import type { Feature, Polygon, MultiPolygon, FeatureCollection } from 'geojson';
+import type { Feature, Polygon, MultiPolygon, FeatureCollection, Position } from 'geojson';
 
 export interface AOIOverlap {
   layerKey: string;
@@ -22,6 +22,100 @@ const LAYER_META: Record<string, { label: string; color: string; emoji: string }
   bc_interior_watersheds: { label: 'Watershed', color: '#3b82f6', emoji: '💧' },
 };
 
+type BBox = [minLng: number, minLat: number, maxLng: number, maxLat: number];
+
+interface AOIPart {
+  feature: Feature<Polygon | MultiPolygon>;
+  polygon: Polygon;
+}
+
+interface AOIIndex {
+  parts: AOIPart[];
+  // Packed [minLng, minLat, maxLng, maxLat] per part, in the same order as parts
+  bboxes: Float64Array;
+}
+
+// AOI layers are static once loaded, so each FeatureCollection is indexed once
+const aoiIndexCache = new WeakMap<FeatureCollection, AOIIndex>();
+
+/**
+ * Bounding box of a polygon's outer ring (holes never extend past it)
+ * Returns null for malformed rings so the caller can skip that part
+ */
+function ringBBox(ring: Position[]): BBox | null {
+  if (!Array.isArray(ring) || ring.length === 0) return null;
+
+  const bbox: BBox = [Infinity, Infinity, -Infinity, -Infinity];
+
+  for (const position of ring) {
+    if (!Array.isArray(position)) return null;
+    const [x, y] = position;
+    if (typeof x !== 'number' || typeof y !== 'number') return null;
+
+    if (x < bbox[0]) bbox[0] = x;
+    if (y < bbox[1]) bbox[1] = y;
+    if (x > bbox[2]) bbox[2] = x;
+    if (y > bbox[3]) bbox[3] = y;
+  }
+
+  return bbox;
+}
+
+/**
+ * Get (or build) the bbox index for an AOI layer
+ * MultiPolygons are exploded into one entry per polygon so each bbox stays tight
+ */
+function getAOIIndex(fc: FeatureCollection): AOIIndex {
+  const cached = aoiIndexCache.get(fc);
+  if (cached) return cached;
+
+  const parts: AOIPart[] = [];
+  const bboxes: number[] = [];
+
+  for (const feature of fc.features) {
+    const geometry = feature.geometry;
+    if (geometry?.type !== 'Polygon' && geometry?.type !== 'MultiPolygon') continue;
+
+    const polygons = geometry.type === 'Polygon'
+      ? [geometry.coordinates]
+      : geometry.coordinates;
+    if (!Array.isArray(polygons)) continue;
+
+    for (const coordinates of polygons) {
+      // Skip invalid geometries
+      if (!Array.isArray(coordinates)) continue;
+      const bbox = ringBBox(coordinates[0]);
+      if (!bbox) continue;
+
+      parts.push({
+        feature: feature as Feature<Polygon | MultiPolygon>,
+        polygon: { type: 'Polygon', coordinates },
+      });
+      bboxes.push(...bbox);
+    }
+  }
+
+  const index = { parts, bboxes: Float64Array.from(bboxes) };
+  aoiIndexCache.set(fc, index);
+  return index;
+}
+
+/**
+ * Indices of the parts whose bbox contains the point, in index order
+ */
+function queryAOIIndex(index: AOIIndex, lat: number, lng: number): number[] {
+  const { bboxes } = index;
+  const candidates: number[] = [];
+
+  for (let i = 0, b = 0; b < bboxes.length; i++, b += 4) {
+    if (lng >= bboxes[b] && lat >= bboxes[b + 1] && lng <= bboxes[b + 2] && lat <= bboxes[b + 3]) {
+      candidates.push(i);
+    }
+  }
+
+  return candidates;
+}
+
 /**
  * Find all AOI polygons that contain the given point
  */
@@ -38,12 +132,19 @@ export function findOverlappingAOIs(
 
     const meta = LAYER_META[layerKey] || { label: layerKey, color: '#94a3b8', emoji: '📍' };
 
-    for (const feature of fc.features) {
-      const geomType = feature.geometry?.type;
-      if (geomType !== 'Polygon' && geomType !== 'MultiPolygon') continue;
+    const index = getAOIIndex(fc);
+    let lastMatched: Feature | null = null;
+
+    // Only parts whose bbox contains the point get the full point-in-polygon test
+    for (const i of queryAOIIndex(index, lat, lng)) {
+      const { feature, polygon } = index.parts[i];
+
+      // Parts of a MultiPolygon are adjacent; report each feature once
+      if (feature === lastMatched) continue;
 
       try {
-        if (booleanPointInPolygon(pt, feature as Feature<Polygon | MultiPolygon>)) {
+        if (booleanPointInPolygon(pt, polygon)) {
+          lastMatched = feature;
           const props = feature.properties || {};
           const name = 
             props.Name || 
@@ -122,19 +223,72 @@ export interface ConsultationContext {
   summary: string;
 }
 
+const EARTH_RADIUS_KM = 6371;
+const DEG_TO_RAD = Math.PI / 180;
+
+interface OfficeColumns {
+  features: GeoJSON.Feature[];
+  lats: Float64Array;
+  lngs: Float64Array;
+}
+
+// POI layers are static once loaded; keep their coordinates as contiguous columns
+const officeColumnsCache = new WeakMap<FeatureCollection, OfficeColumns>();
+
 /**
- * Calculate haversine distance between two points (km)
+ * Get (or build) the point coordinates of a POI layer as parallel arrays
  */
-function haversineDistance(lat1: number, lng1: number, lat2: number, lng2: number): number {
-  const R = 6371; // Earth's radius in km
-  const dLat = (lat2 - lat1) * Math.PI / 180;
-  const dLng = (lng2 - lng1) * Math.PI / 180;
-  const a = 
-    Math.sin(dLat / 2) ** 2 +
-    Math.cos(lat1 * Math.PI / 180) * Math.cos(lat2 * Math.PI / 180) *
-    Math.sin(dLng / 2) ** 2;
-  const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
-  return R * c;
+function getOfficeColumns(fc: FeatureCollection): OfficeColumns {
+  const cached = officeColumnsCache.get(fc);
+  if (cached) return cached;
+
+  const features: GeoJSON.Feature[] = [];
+  const lats: number[] = [];
+  const lngs: number[] = [];
+
+  for (const feature of fc.features) {
+    if (feature.geometry?.type !== 'Point') continue;
+    const coords = feature.geometry.coordinates;
+    if (!coords || coords.length < 2) continue;
+
+    features.push(feature);
+    lngs.push(coords[0]);
+    lats.push(coords[1]);
+  }
+
+  const columns = { features, lats: Float64Array.from(lats), lngs: Float64Array.from(lngs) };
+  officeColumnsCache.set(fc, columns);
+  return columns;
+}
+
+/**
+ * Calculate haversine distances (km) from one origin to the selected points
+ * Origin radians and cosine are computed once for the whole batch
+ */
+function haversineDistances(
+  lat: number,
+  lng: number,
+  lats: ArrayLike<number>,
+  lngs: ArrayLike<number>,
+  indices: ArrayLike<number>
+): Float64Array {
+  const lat0 = lat * DEG_TO_RAD;
+  const lng0 = lng * DEG_TO_RAD;
+  const cosLat0 = Math.cos(lat0);
+  const distances = new Float64Array(indices.length);
+
+  for (let j = 0; j < indices.length; j++) {
+    const i = indices[j];
+    const lat2 = lats[i] * DEG_TO_RAD;
+    const dLat = lat2 - lat0;
+    const dLng = lngs[i] * DEG_TO_RAD - lng0;
+    const a =
+      Math.sin(dLat / 2) ** 2 +
+      cosLat0 * Math.cos(lat2) * Math.sin(dLng / 2) ** 2;
+    distances[j] = EARTH_RADIUS_KM * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+  }
+
+  return distances;
 }
 
 /**
@@ -148,24 +302,32 @@ export function findNearbyOffices(
 ): FirstNationOffice[] {
   if (!poiGeojson?.features) return [];
   
+  const { features, lats, lngs } = getOfficeColumns(poiGeojson);
+  
+  // Great-circle distance is never less than the latitude difference, so
+  // points outside this band are dropped before any trig
+  const maxDeltaLat = maxDistance / (EARTH_RADIUS_KM * DEG_TO_RAD);
+  const candidates: number[] = [];
+  
+  for (let i = 0; i < lats.length; i++) {
+    if (Math.abs(lats[i] - lat) <= maxDeltaLat) candidates.push(i);
+  }
+  
+  const distances = haversineDistances(lat, lng, lats, lngs, candidates);
   const offices: FirstNationOffice[] = [];
   
-  for (const feature of poiGeojson.features) {
-    if (feature.geometry?.type !== 'Point') continue;
-    const coords = feature.geometry.coordinates;
-    if (!coords || coords.length < 2) continue;
-    
-    const [officeLng, officeLat] = coords;
-    const distance = haversineDistance(lat, lng, officeLat, officeLng);
+  for (let j = 0; j < candidates.length; j++) {
+    const distance = distances[j];
     
     if (distance <= maxDistance) {
-      const props = feature.properties || {};
+      const i = candidates[j];
+      const props = features[i].properties || {};
       offices.push({
         name: String(props.name || props.Name || 'Unknown'),
         code: typeof props.code === 'number' ? props.code : undefined,
         distance: Math.round(distance * 10) / 10,
-        lat: officeLat,
-        lng: officeLng,
+        lat: lats[i],
+        lng: lngs[i],
       });
     }
   }
@@ -11,6 +11,13 @@ import confusablesData from '../data/secwepemc/confusables.json';
 const confusableEntries = Object.entries(confusablesData.confusables as Record<string, string>)
   .sort((a, b) => b[0].length - a[0].length);
 
+const escapeRegExp = (value: string) => value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// Single alternation of all confusables, used for presence checks only
+const confusablePattern = confusableEntries.length > 0
+  ? new RegExp(confusableEntries.map(([confusable]) => escapeRegExp(confusable)).join('|'))
+  : null;
+
 /**
  * Normalize a Secwépemctsín text by replacing confusable characters with canonical forms
  * 
@@ -39,12 +46,7 @@ export function normalizeSecwepemc(text: string): string {
  * Useful for validation and data quality checks
  */
 export function hasConfusables(text: string): boolean {
-  for (const [confusable] of confusableEntries) {
-    if (text.includes(confusable)) {
-      return true;
-    }
-  }
-  return false;
+  return confusablePattern !== null && text.search(confusablePattern) !== -1;
 }
 
 /**
@@ -1,5 +1,7 @@
 export type OcrQuality = "high" | "medium" | "low" | null;
 
+const CLEAN_CHAR_RE = /[a-zA-Z0-9\s.,;:'"()-]/;
+
 export function computeOcrQuality(text?: string | null): OcrQuality {
   if (!text) return null;
   const trimmed = text.trim();
@@ -9,7 +11,7 @@ export function computeOcrQuality(text?: string | null): OcrQuality {
   let clean = 0;
   let noisy = 0;
   for (const ch of trimmed) {
-    if (/[a-zA-Z0-9\s.,;:'"()-]/.test(ch)) clean += 1;
+    if (CLEAN_CHAR_RE.test(ch)) clean += 1;
     else noisy += 1;
   }
   const ratio = clean / (clean + noisy || 1);